@@ -0,0 +1,55 @@
+"""Checks for the rotation function's notification handler.
+
+The function's modules are imported straight from the packaged zip.
+"""
+
+import logging
+import os
+import sys
+
+import pytest
+from botocore.stub import Stubber
+
+LAMBDA_PACKAGE = os.path.join(os.path.dirname(__file__), os.pardir, 'Lambda',
+                              'access_key_auto_rotation.zip')
+
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+os.environ.setdefault('CredentialReplicationRegions', '')
+os.environ.setdefault('NotifierArn', 'arn:aws:lambda:us-east-1:111111111111:function:ASA-Notifier')
+sys.path.insert(0, os.environ.get('LAMBDA_PACKAGE', LAMBDA_PACKAGE))
+
+import notification_handler  # noqa: E402
+
+
+@pytest.fixture
+def lambda_client():
+    return notification_handler.lambda_client
+
+
+def test_throttled_invoke_is_logged_not_raised(lambda_client, caplog):
+    notifications = [{'email': 'owner@example.com'}]
+    with Stubber(lambda_client) as stubber:
+        stubber.add_client_error('invoke',
+                                 service_error_code='TooManyRequestsException',
+                                 http_status_code=429)
+        with caplog.at_level(logging.ERROR):
+            responses = notification_handler.send_to_notifier(notifications)
+        stubber.assert_no_pending_responses()
+
+    assert responses == []
+    assert 'TooManyRequestsException' in caplog.text
+
+
+def test_oversized_batch_is_sent_one_notification_at_a_time(lambda_client):
+    notifications = [{'email': 'owner@example.com'},
+                     {'email': 'resource-owner@example.com'}]
+    with Stubber(lambda_client) as stubber:
+        stubber.add_client_error('invoke',
+                                 service_error_code='RequestTooLargeException',
+                                 http_status_code=413)
+        stubber.add_response('invoke', {'StatusCode': 202})
+        stubber.add_response('invoke', {'StatusCode': 202})
+        responses = notification_handler.send_to_notifier(notifications)
+        stubber.assert_no_pending_responses()
+
+    assert len(responses) == 2